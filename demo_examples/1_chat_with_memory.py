@@ -19,7 +19,7 @@ Seeds memory with fake chat history (seed_chat_memory_demo):
 
 Chat agent with memory loading (chat_agent_with_memory):
     Startup phase:
-        Loads up to 50 previous chat turns from memory using mem.recent_data()
+        Loads up to MAX_LOADED_TURNS (50) previous chat turns from memory using mem.recent_data()
         Injects loaded history into conversation buffer
         Tells user: "🧠 I loaded X previous chat turns into context"
     Chat loop:
@@ -27,12 +27,13 @@ Chat agent with memory loading (chat_agent_with_memory):
         Each turn (user + assistant) recorded to:
             Memory (mem.record()) - persistent storage
             Local buffer (conversation) - current session
-        LLM gets last 10 turns as context (including loaded history)
+        LLM gets the most recent turns that fit a token budget (including loaded history)
         Agent can reference past conversations: "what have we talked about?"
         Type 'quit'/'exit' to end
 
 Wrap-up:
-    Summarizes entire conversation using LLM
+    Summarizes entire conversation using LLM (a rolling summary is kept up to date
+    in the background every few turns, so this final call stays small)
     Saves conversation + summary as JSON artifact
     Shows summary to user
 
@@ -50,10 +51,155 @@ This pattern enables stateful chatbots that maintain continuity across sessions,
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+from operator import itemgetter
 from typing import Any, Dict, List
 
-from aethergraph import graph_fn, NodeContext
+from aethergraph import graph_fn, NodeContext, start_server
+from aethergraph.runner import run_async
+
+
+# Token budget and turn cap for the chat history sent to the LLM (system prompt excluded).
+HISTORY_TOKEN_BUDGET = 3000
+MAX_CONTEXT_TURNS = 10
+
+# Time limit for a whole streamed reply.
+REPLY_TIMEOUT_S = 120.0
+
+# Fold new turns into the rolling session summary every N turns.
+SUMMARY_EVERY_TURNS = 10
+
+# Roles we accept from stored chat_turn records, and a cap on how many we load.
+_ROLES = frozenset({"user", "assistant"})
+_ROLE_TEXT = itemgetter("role", "text")
+MAX_LOADED_TURNS = 50
+
+# The (role, text) turns seed_chat_memory_demo writes on every start.
+_SEED_TURNS = (
+    ("user", "We talked about integrating AetherGraph into my project."),
+    ("assistant", "I suggested starting with a simple graph_fn and adding services later."),
+)
+
+# Fixed prompts and tags, built once and reused on every turn.
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful, concise assistant."}
+_SUMMARY_SYSTEM_MSG = {"role": "system", "content": "You write clear, concise summaries."}
+_ROLLING_SUMMARY_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You maintain a rolling summary of a conversation. "
+    "Merge the new turns into the existing summary. "
+    "Focus on main topics, decisions, and any TODOs.",
+}
+_USER_TAGS = ("chat", "user")
+_ASSISTANT_TAGS = ("chat", "assistant")
+
+
+def _count_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token); no tokenizer dependency needed."""
+    return max(1, len(text) // 4)
+
+
+def _fit_to_budget(
+    roles: List[str],
+    texts: List[str],
+    *,
+    budget: int = HISTORY_TOKEN_BUDGET,
+    max_turns: int = MAX_CONTEXT_TURNS,
+    keep_first: bool = True,
+) -> List[int]:
+    """
+    Return the indices of the most recent turns (at most `max_turns`) that fit
+    into `budget` tokens.
+
+    - 10% of the budget is held back as a safety buffer for estimation error.
+    - The newest turn is always kept, even if it alone exceeds the budget.
+    - The window always opens on a user turn.
+    - With keep_first=True the very first turn is kept as an anchor when it fits.
+    """
+    limit = int(budget * 0.9)
+    used = 0
+    start = len(texts)
+    while start > 0 and len(texts) - start < max_turns:
+        cost = _count_tokens(texts[start - 1])
+        if start < len(texts) and used + cost > limit:
+            break
+        start -= 1
+        used += cost
+
+    while start < len(roles) - 1 and roles[start] != "user":
+        used -= _count_tokens(texts[start])
+        start += 1
+
+    indices = list(range(start, len(texts)))
+    if keep_first and start > 0 and roles[0] == "user" and used + _count_tokens(texts[0]) <= limit:
+        indices.insert(0, 0)
+    return indices
+
+
+async def _chat_with_retry(
+    llm,
+    messages: List[Dict[str, Any]],
+    *,
+    attempts: int = 3,
+    timeout: float = 30.0,
+):
+    """
+    llm.chat() with a per-call timeout and exponential backoff on transient
+    errors (timeouts, dropped connections). Returns whatever llm.chat() returns.
+    """
+    delay = 0.5
+    for attempt in range(attempts):
+        try:
+            return await asyncio.wait_for(llm.chat(messages=messages), timeout=timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+async def _stream_reply(
+    llm,
+    chan,
+    messages: List[Dict[str, Any]],
+    *,
+    timeout: float = REPLY_TIMEOUT_S,
+) -> str:
+    """
+    Stream the LLM reply into the channel while it is being generated, so the
+    user sees the first tokens right away instead of waiting for the full answer.
+
+    llm.chat_stream() forwards each text delta to the channel stream and falls
+    back to a plain chat() internally for providers without streaming.
+
+    The whole reply is bounded by `timeout`; on expiry the text streamed so far
+    is kept. If the stream fails before producing any text, the reply comes
+    from _chat_with_retry() instead.
+    """
+    chunks: List[str] = []
+
+    async with chan.stream() as s:
+        async def on_delta(piece: str) -> None:
+            chunks.append(piece)
+            await s.delta(piece)
+
+        try:
+            reply, _usage = await asyncio.wait_for(
+                llm.chat_stream(messages=messages, on_delta=on_delta), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            reply = "".join(chunks) + " …" if chunks else "(No reply: the model timed out.)"
+        except Exception:
+            if chunks:
+                reply = "".join(chunks) + " …"
+            else:
+                reply, _usage = await _chat_with_retry(llm, messages)
+
+        if not chunks:
+            await s.delta(reply)
+        # The caller records the assistant turn itself, so skip the stream's memory log.
+        await s.end(full_text=reply, memory_log=False)
+    return reply
 
 
 @graph_fn(name="seed_chat_memory_demo")
@@ -73,16 +219,17 @@ async def seed_chat_memory_demo(*, context: NodeContext):
     #   and store it in Event.text, so later we can reconstruct it with json.loads(evt.text).
     # - to retrieve the data, use mem.recent_data(kinds=["chat_turn"]) which
     #   will return a list of decoded dicts.
+    # Write order is conversation order (recent_data returns it as-is), so these stay sequential.
     await mem.record(
         kind="chat_turn",
-        data={"role": "user", "text": "We talked about integrating AetherGraph into my project."},
+        data={"role": "user", "text": _SEED_TURNS[0][1]},
         tags=["chat", "user", "seed"],
         severity=2,
         stage="observe",
     )
     await mem.record(
         kind="chat_turn",
-        data={"role": "assistant", "text": "I suggested starting with a simple graph_fn and adding services later."},
+        data={"role": "assistant", "text": _SEED_TURNS[1][1]},
         tags=["chat", "assistant", "seed"],
         severity=2,
         stage="act",
@@ -111,17 +258,70 @@ async def chat_agent_with_memory(*, context: NodeContext):
     artifacts = context.artifacts()
     llm = context.llm()
 
+    # Start fetching prior chat turns right away; the fetch overlaps with the
+    # local setup below and is awaited in the warmup section.
+    # recent_data() returns whatever you passed as `data=` to mem.record(...)
+    # In this example, that's dicts like {"role": "user"|"assistant", "text": "..."}.
+    prev_task = asyncio.create_task(mem.recent_data(kinds=["chat_turn"], limit=MAX_LOADED_TURNS))
+
     logger.info("chat_agent_with_memory started")
 
-    # Local log to save as an artifact later.
+    # Local log to save as an artifact later, kept as two parallel lists
+    # (roles[i], texts[i]) instead of one dict per turn.
     # We will PRE-SEED this with prior chat_turns from memory.
-    conversation: List[Dict[str, Any]] = []
-
-    # ---------- Warmup: load prior chat history into conversation ----------
+    roles: List[str] = []
+    texts: List[str] = []
+
+    # Memory writes run as background tasks so they overlap with LLM think-time
+    # instead of sitting on the chat latency path. They are drained before wrap-up.
+    bg_tasks: set[asyncio.Task] = set()
+    max_bg_tasks = 64
+
+    async def _fire(coro) -> None:
+        # Soft cap: if too many writes are in flight, wait for one to finish first.
+        if len(bg_tasks) >= max_bg_tasks:
+            await asyncio.wait(bg_tasks, return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.create_task(coro)
+        bg_tasks.add(task)
+        task.add_done_callback(bg_tasks.discard)
+
+    # Rolling summary: older turns are folded into `running_summary` in the
+    # background every SUMMARY_EVERY_TURNS turns, so the final summary call only
+    # has to merge it with the last few unsummarized turns.
+    running_summary = ""
+    summarized_upto = 0  # turns [:summarized_upto] are covered by running_summary
+    summary_task: asyncio.Task | None = None
+
+    async def _update_summary(prev: str, start: int, end: int):
+        new_block = "\n".join(
+            f"{role}: {text}" for role, text in zip(roles[start:end], texts[start:end])
+        )
+        text, _ = await _chat_with_retry(
+            llm,
+            [
+                _ROLLING_SUMMARY_SYSTEM_MSG,
+                {
+                    "role": "user",
+                    "content": f"Current summary:\n{prev or '(empty)'}\n\nNew turns:\n{new_block}",
+                },
+            ],
+        )
+        return text, end
+
+    async def _harvest_summary() -> None:
+        nonlocal running_summary, summarized_upto, summary_task
+        if summary_task is None:
+            return
+        try:
+            running_summary, summarized_upto = await summary_task
+        except Exception as e:
+            # Keep the old summary; the turns stay unsummarized and are retried later.
+            logger.warning("Failed to update rolling summary: %s", e)
+        summary_task = None
+
+    # ---------- Warmup: load prior chat history into the local log ----------
     try:
-        # recent_data() returns whatever you passed as `data=` to mem.record(...)
-        # In this example, that's dicts like {"role": "user"|"assistant", "text": "..."}.
-        previous_turns = await mem.recent_data(kinds=["chat_turn"], limit=50)
+        previous_turns = await prev_task
         logger.info(
             "🧠 [ChatAgent] Loaded %d decoded chat_turn records from memory",
             len(previous_turns),
@@ -131,16 +331,27 @@ async def chat_agent_with_memory(*, context: NodeContext):
         previous_turns = []
 
     if previous_turns:
-        loaded = 0
-        for d in previous_turns:
-            # Guard against unexpected shapes
-            if not isinstance(d, dict):
-                continue
-            role = d.get("role")
-            text = d.get("text")
-            if role in ("user", "assistant") and text:
-                conversation.append({"role": role, "text": text})
-                loaded += 1
+        # Keep well-formed turns only (guard against unexpected shapes), as (role, text) pairs.
+        pairs = [
+            _ROLE_TEXT(d)
+            for d in previous_turns
+            if isinstance(d, dict) and d.get("role") in _ROLES and d.get("text")
+        ]
+        # The seed graph runs on every start, so its turns can show up many times;
+        # keep only their first occurrence. Other repeats ("yes", "thanks") are real turns.
+        seen_seed = set()
+        unique = []
+        for pair in pairs:
+            if pair in _SEED_TURNS:
+                if pair in seen_seed:
+                    continue
+                seen_seed.add(pair)
+            unique.append(pair)
+        if unique:
+            loaded_roles, loaded_texts = zip(*unique)
+            roles.extend(loaded_roles)
+            texts.extend(loaded_texts)
+        loaded = len(unique)
 
         await chan.send_text(
             f"🧠 I loaded {loaded} previous chat turns into context.\n"
@@ -152,67 +363,96 @@ async def chat_agent_with_memory(*, context: NodeContext):
     await chan.send_text("Type 'quit' or 'exit' to end the session.")
 
     # ---------- Main chat loop ----------
-    while True:
-        user = await chan.ask_text("You:")
-        if not user:
-            # empty line, just keep going
-            continue
-
-        normalized = user.strip().lower()
-        if normalized in ("quit", "exit"):
-            await chan.send_text("👋 Ending session. Let me summarize what we discussed...")
-            break
-
-        # Record user turn in memory + local buffer
-        conversation.append({"role": "user", "text": user})
-        await mem.record(
-            kind="chat_turn",
-            data={"role": "user", "text": user},
-            tags=["chat", "user"],
-            severity=2,
-            stage="observe",
-        )
-
-        # Build context for LLM from the last few turns (including seeded ones)
-        history_tail = conversation[-10:]  # user/assistant pairs, up to 10 turns
+    loop_done = False
+    try:
+        while True:
+            user = await chan.ask_text("You:")
+            if not user:
+                # empty line, just keep going
+                continue
 
-        messages = [{"role": "system", "content": "You are a helpful, concise assistant."}]
-        for turn in history_tail:
-            messages.append(
-                {
-                    "role": turn["role"],
-                    "content": turn["text"],
-                }
+            normalized = user.strip().lower()
+            if normalized in ("quit", "exit"):
+                await chan.send_text("👋 Ending session. Let me summarize what we discussed...")
+                break
+
+            # Record user turn in memory (in the background) + local buffer
+            roles.append("user")
+            texts.append(user)
+            await _fire(
+                mem.record(
+                    kind="chat_turn",
+                    data={"role": "user", "text": user},
+                    tags=list(_USER_TAGS),
+                    severity=2,
+                    stage="observe",
+                )
             )
 
-        reply, _usage = await llm.chat(messages=messages)
-
-        # Record assistant turn
-        conversation.append({"role": "assistant", "text": reply})
-        await mem.record(
-            kind="chat_turn",
-            data={"role": "assistant", "text": reply},
-            tags=["chat", "assistant"],
-            severity=2,
-            stage="act",
-        )
-
-        await chan.send_text(reply)
+            # Build context for LLM from the most recent turns (including seeded ones)
+            # that fit into the token budget.
+            history_idx = _fit_to_budget(roles, texts)
+
+            messages = [_SYSTEM_MSG]
+            messages.extend({"role": roles[i], "content": texts[i]} for i in history_idx)
+
+            # Stream the reply to the user; memory gets the assembled text afterwards.
+            reply = await _stream_reply(llm, chan, messages)
+
+            # Record assistant turn
+            roles.append("assistant")
+            texts.append(reply)
+            await _fire(
+                mem.record(
+                    kind="chat_turn",
+                    data={"role": "assistant", "text": reply},
+                    tags=list(_ASSISTANT_TAGS),
+                    severity=2,
+                    stage="act",
+                )
+            )
 
-    # ---------- Wrap-up summary from local conversation ----------
-    hist_text = "\n".join(
-        f"{turn['role']}: {turn['text']}" for turn in conversation[-20:]
-    )
-    summary_prompt = (
+            # Fold older turns into the rolling summary (one update in flight at a time).
+            if summary_task is not None and summary_task.done():
+                await _harvest_summary()
+            if summary_task is None and len(roles) - summarized_upto >= SUMMARY_EVERY_TURNS:
+                summary_task = asyncio.create_task(
+                    _update_summary(running_summary, summarized_upto, len(roles))
+                )
+        loop_done = True
+    finally:
+        # Make sure every memory write has landed, even if the loop raised.
+        if bg_tasks:
+            results = await asyncio.gather(*bg_tasks, return_exceptions=True)
+            for res in results:
+                if isinstance(res, Exception):
+                    logger.warning("Failed to record chat turn: %s", res)
+        # On a normal exit the wrap-up below harvests the rolling summary; otherwise stop it.
+        if not loop_done and summary_task is not None:
+            summary_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await summary_task
+
+    # ---------- Wrap-up summary from rolling summary + unsummarized turns ----------
+    await _harvest_summary()
+    # Build the prompt from its pieces in a single join (no intermediate strings).
+    parts = [
         "Summarize the following conversation between a user and an assistant. "
         "Focus on main topics, decisions, and any TODOs.\n\n"
-        f"{hist_text}"
+    ]
+    if running_summary:
+        parts.append(f"Summary of earlier turns:\n{running_summary}\n\nRecent turns:\n")
+    parts.extend(
+        f"{role}: {text}\n"
+        for role, text in zip(roles[summarized_upto:], texts[summarized_upto:])
     )
-    summary_text, _ = await llm.chat(
-        messages=[
-            {"role": "system", "content": "You write clear, concise summaries."},
+    summary_prompt = "".join(parts)
+    summary_text, _ = await _chat_with_retry(
+        llm,
+        [
+            _SUMMARY_SYSTEM_MSG,
             {"role": "user", "content": summary_prompt},
-        ]
+        ],
     )
 
     await chan.send_text("📌 Session summary:\n" + summary_text)
@@ -220,7 +460,7 @@ async def chat_agent_with_memory(*, context: NodeContext):
     # ---------- Optional: save conversation + summary as an artifact ----------
     try:
         payload = {
-            "conversation": conversation,
+            "conversation": [{"role": r, "text": t} for r, t in zip(roles, texts)],
             "summary": summary_text,
         }
         saved = await artifacts.save_json(
@@ -233,34 +473,31 @@ async def chat_agent_with_memory(*, context: NodeContext):
     logger.info("chat_agent_with_memory finished")
 
     return {
-        "turns": len(conversation),
+        "turns": len(roles),
         "summary": summary_text,
     }
 
 
-if __name__ == "__main__":
-    import asyncio
-    from aethergraph.runner import run_async
-    from aethergraph import start_server
+async def main():
+    # 1) Seed some prior memory so the agent has history on first run
+    await run_async(
+        seed_chat_memory_demo,
+        inputs={},
+        run_id="demo_chat_with_memory",
+    )
+
+    # 2) Start the chat agent (same run_id to share memory)
+    result = await run_async(
+        chat_agent_with_memory,
+        inputs={},
+        run_id="demo_chat_with_memory",
+    )
+    print("Result:", result)
+
 
+if __name__ == "__main__":
     # Start sidecar for channel communication (console/web/slack/etc.)
     url = start_server(port=8000, log_level="warning")
     print("AetherGraph sidecar server started at:", url)
 
-    async def main():
-        # 1) Seed some prior memory so the agent has history on first run
-        await run_async(
-            seed_chat_memory_demo,
-            inputs={},
-            run_id="demo_chat_with_memory",
-        )
-
-        # 2) Start the chat agent (same run_id to share memory)
-        result = await run_async(
-            chat_agent_with_memory,
-            inputs={},
-            run_id="demo_chat_with_memory",
-        )
-        print("Result:", result)
-
     asyncio.run(main())
@@ -48,16 +48,23 @@ This is a canonical example of building conversational, user-driven workflows wi
 
 from __future__ import annotations
 
+import asyncio
 import json
 import pathlib
+import re
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Any, Dict
 
 from aethergraph import graph_fn, NodeContext
 
 
+# Accept plain positive numbers only (no "+5", "1_000", "nan", ...).
+_POS_INT_RE = re.compile(r"^[1-9]\d*$")
+_POS_FLOAT_RE = re.compile(r"^(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$")
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExperimentConfig:
     project: str
     steps: int
@@ -66,6 +73,13 @@ class ExperimentConfig:
     debug_logging: bool = False
 
 
+@lru_cache(maxsize=32)
+def _format_config(config: ExperimentConfig) -> str:
+    """Pretty JSON preview of a config; cached so Restart cycles that land on the
+    same answers don't re-serialize them (frozen configs are hashable)."""
+    return json.dumps(asdict(config), indent=2)
+
+
 @graph_fn(name="channel_wizard")
 async def channel_wizard(*, context: NodeContext):
     """
@@ -110,15 +124,12 @@ async def channel_wizard(*, context: NodeContext):
         while True:
             steps_str = await chan.ask_text("Number of steps (e.g. 10)?")
             steps_str = steps_str.strip()
-            try:
+            if _POS_INT_RE.match(steps_str):
                 steps = int(steps_str)
-                if steps <= 0:
-                    raise ValueError("steps must be positive")
                 break
-            except Exception:
-                await chan.send_text(
-                    f"⚠️ Could not parse '{steps_str}' as a positive integer. Please try again."
-                )
+            await chan.send_text(
+                f"⚠️ Could not parse '{steps_str}' as a positive integer. Please try again."
+            )
 
         # -------------------------------
         # Step 2 – advanced mode
@@ -140,15 +151,13 @@ async def channel_wizard(*, context: NodeContext):
             while True:
                 lr_str = await chan.ask_text("Learning rate (e.g. 0.001)?")
                 lr_str = lr_str.strip()
-                try:
+                if _POS_FLOAT_RE.match(lr_str):
                     learning_rate = float(lr_str)
-                    if learning_rate <= 0:
-                        raise ValueError("lr must be positive")
-                    break
-                except Exception:
-                    await chan.send_text(
-                        f"⚠️ Could not parse '{lr_str}' as a positive float. Please try again."
-                    )
+                    if learning_rate > 0:
+                        break
+                await chan.send_text(
+                    f"⚠️ Could not parse '{lr_str}' as a positive float. Please try again."
+                )
 
             # Ask for debug logging
             dbg_res = await chan.ask_approval(
@@ -171,7 +180,7 @@ async def channel_wizard(*, context: NodeContext):
         # -------------------------------
         await chan.send_text("Step 3/3 – Review configuration")
 
-        pretty_config = json.dumps(asdict(config), indent=2)
+        pretty_config = _format_config(config)
         await chan.send_text(
             "Here is the configuration I’ve collected:\n"
             f"```json\n{pretty_config}\n```"
@@ -205,9 +214,11 @@ async def channel_wizard(*, context: NodeContext):
 
     config_dict: Dict[str, Any] = asdict(config)
 
-    # Write to local JSON file
+    # Write to local JSON file. The preview JSON shown in Step 3 is exactly what
+    # we want on disk, so reuse the cached string instead of serializing again.
+    # The disk write runs in a worker thread so it doesn't block the event loop.
     path = pathlib.Path("./run_config.json")
-    path.write_text(json.dumps(config_dict, indent=2), encoding="utf-8")
+    await asyncio.to_thread(path.write_bytes, _format_config(config).encode("utf-8"))
 
     # Save as an artifact (kind + labels help later search)
     saved = await artifacts.save(
@@ -36,10 +36,9 @@ This pattern scales to real ML training loops with complex metrics and automated
 
 from __future__ import annotations
 
-import json
-import pathlib
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple
 
 from aethergraph import graph_fn, NodeContext
 
@@ -54,33 +53,36 @@ class Params2D:
     y: float
 
 
-def simulate(params: Params2D) -> Dict[str, float]:
+class StepOut(NamedTuple):
+    loss: float
+    grad_x: float
+    grad_y: float
+
+
+def simulate(params: Params2D) -> StepOut:
     """
     Toy objective:
         f(x, y) = (x - 3)^2 + (y + 1)^2
 
-    Returns a dict with:
-        - "loss"
-        - "grad_x"
-        - "grad_y"
+    Returns a StepOut(loss, grad_x, grad_y) tuple.
     """
     dx = params.x - 3.0
     dy = params.y + 1.0
     loss = dx * dx + dy * dy
     grad_x = 2.0 * dx
     grad_y = 2.0 * dy
-    return {"loss": loss, "grad_x": grad_x, "grad_y": grad_y}
+    return StepOut(loss, grad_x, grad_y)
 
 
-def apply_gradient_step(params: Params2D, grads: Dict[str, float], lr: float) -> Params2D:
+def apply_gradient_step(params: Params2D, grads: StepOut, lr: float) -> Params2D:
     """
     Basic gradient descent update:
         x <- x - lr * grad_x
         y <- y - lr * grad_y
     """
     return Params2D(
-        x=params.x - lr * grads["grad_x"],
-        y=params.y - lr * grads["grad_y"],
+        x=params.x - lr * grads.grad_x,
+        y=params.y - lr * grads.grad_y,
     )
 
 
@@ -95,6 +97,8 @@ async def optimization_loop(
     num_steps: int = 30,
     learning_rate: float = 0.1,
     checkpoint_every: int = 5,
+    mem_flush_every: int | None = None,
+    progress_every: int = 0,
 ):
     """
     Run a simple gradient descent loop and log its trajectory.
@@ -102,13 +106,15 @@ async def optimization_loop(
     Behavior:
       - Starts from (x, y) = (0, 0).
       - For num_steps:
-          * computes loss and gradients,
-          * updates parameters,
-          * appends (step, params, loss) to a metrics list,
-          * logs each step to memory.
+          * computes loss and gradients, then updates parameters,
+          * keeps (step, params, loss, grads) as metrics columns,
+          * queues a memory event for the step; queued events are flushed
+            every `mem_flush_every` steps (defaults to `checkpoint_every`).
       - Every `checkpoint_every` steps:
-          * writes a small checkpoint file,
-          * saves it as an artifact (with loss as a metric).
+          * saves a small checkpoint as an artifact (with loss as a metric).
+      - If `progress_every` > 0, a progress line for the latest step is sent to
+        the channel every `progress_every` steps. With the default (0) the loop
+        makes no per-step channel calls or string formatting at all.
       - At the end:
           * saves final parameters and metrics as artifacts,
           * returns basic summary info.
@@ -128,7 +134,45 @@ async def optimization_loop(
 
     # Initial parameters
     params = Params2D(x=0.0, y=0.0)
-    metrics: List[Dict[str, float]] = []
+
+    # Metrics stay column-wise ({"step": [...], "x": [...], ...}), which is how
+    # they are consumed downstream and is more compact as JSON than one dict per step.
+    metrics: Dict[str, List[float]] = {
+        name: [] for name in ("step", "x", "y", "loss", "grad_x", "grad_y")
+    }
+
+    # Per-step memory events are buffered and flushed in batches instead of one
+    # sidecar round-trip per step.
+    if mem_flush_every is None:
+        mem_flush_every = checkpoint_every
+    pending_mem: List[Dict[str, Any]] = []
+
+    async def _flush_mem() -> None:
+        if not pending_mem:
+            return
+        batch = pending_mem[:]
+        pending_mem.clear()
+        # shield: a cancelled run should not drop events that are already in flight.
+        await asyncio.shield(asyncio.gather(*(mem.record(**evt) for evt in batch)))
+
+    # Checkpoint saves run in the background so the loop never waits on artifact
+    # I/O; each checkpoint has its own URI, so overlapping saves don't collide.
+    pending_saves: List[asyncio.Task] = []
+
+    async def _save_checkpoint(step: int, ckpt: Dict[str, Any], loss: float):
+        # save_json() hands the payload straight to the artifact store,
+        # no local temp file needed.
+        # NOTE: we now pass `metrics={"loss": loss}` so the index can later
+        # find the "best" checkpoint by minimum loss.
+        saved = await artifacts.save_json(
+            ckpt,
+            kind="optimization_checkpoint",
+            labels={"example": "optimization_loop", "step": str(step)},
+            metrics={"loss": float(loss)},
+            suggested_uri=f"./checkpoints/step_{step}.json", # under workspaces/artifacts/
+            pin=True,
+        )
+        return step, saved
 
     await chan.send_text(
         f"🚀 Starting optimization demo: minimize (x-3)^2 + (y+1)^2\n"
@@ -138,33 +182,37 @@ async def optimization_loop(
 
     for step in range(1, num_steps + 1):
         results = simulate(params)
-        loss = results["loss"]
-        grad_x = results["grad_x"]
-        grad_y = results["grad_y"]
-
-        metrics.append(
+        loss = results.loss
+
+        metrics["step"].append(step)
+        metrics["x"].append(params.x)
+        metrics["y"].append(params.y)
+        metrics["loss"].append(loss)
+        metrics["grad_x"].append(results.grad_x)
+        metrics["grad_y"].append(results.grad_y)
+
+        # Optional live progress: disabled by default (just a branch, no channel
+        # call). When enabled, only the steps that are actually sent get formatted;
+        # the full numeric trajectory is in memory/metrics for pretty-printing later.
+        if progress_every and (step % progress_every == 0 or step == num_steps):
+            await chan.send_text(f"step={step} loss={loss:.6f}")
+
+        # Per-step memory log: small, structured event (flushed in batches)
+        pending_mem.append(
             {
-                "step": step,
-                "x": params.x,
-                "y": params.y,
-                "loss": loss,
-                "grad_x": grad_x,
-                "grad_y": grad_y,
+                "kind": "optimization_step",
+                "data": {
+                    "step": step,
+                    "x": params.x,
+                    "y": params.y,
+                    "loss": loss,
+                },
+                "metrics": {"loss": float(loss)},
+                "tags": ["optimization_loop"],
             }
         )
-
-        # Per-step memory log: small, structured event
-        await mem.record(
-            kind="optimization_step",
-            data={
-                "step": step,
-                "x": params.x,
-                "y": params.y,
-                "loss": loss,
-            },
-            metrics={"loss": float(loss)},
-            tags=["optimization_loop"],
-        )
+        if step % mem_flush_every == 0 or step == num_steps:
+            await _flush_mem()
 
         # Save checkpoint every `checkpoint_every` steps
         if step % checkpoint_every == 0 or step == num_steps:
@@ -173,51 +221,40 @@ async def optimization_loop(
                 "params": {"x": params.x, "y": params.y},
                 "loss": loss,
             }
-            ckpt_path = pathlib.Path(f"./checkpoint_step_{step}.json")
-            ckpt_path.write_text(json.dumps(ckpt, indent=2), encoding="utf-8")
-
-            # NOTE: we now pass `metrics={"loss": loss}` so the index can later
-            # find the "best" checkpoint by minimum loss.
-            saved_ckpt = await artifacts.save(
-                str(ckpt_path),
-                kind="optimization_checkpoint",
-                labels={"example": "optimization_loop", "step": str(step)},
-                metrics={"loss": float(loss)},
-                suggested_uri=f"./checkpoints/step_{step}.json", # under workspaces/artifacts/
-                pin=True,
-            )
-            logger.info("Saved checkpoint artifact at step %d: %s", step, saved_ckpt.uri)
+            pending_saves.append(asyncio.create_task(_save_checkpoint(step, ckpt, loss)))
 
         # Gradient step update
         params = apply_gradient_step(params, results, learning_rate)
 
+    # Wait for all in-flight checkpoint saves before the final artifacts.
+    for saved_step, saved_ckpt in await asyncio.gather(*pending_saves):
+        logger.info("Saved checkpoint artifact at step %d: %s", saved_step, saved_ckpt.uri)
+
     # After the loop: save final parameters & metrics as artifacts.
+    # The two saves are independent, so issue them concurrently.
     final_params = {"x": params.x, "y": params.y}
 
-    final_params_path = pathlib.Path("./final_params.json")
-    final_params_path.write_text(json.dumps(final_params, indent=2), encoding="utf-8")
-    saved_params = await artifacts.save(
-        str(final_params_path),
-        kind="optimization_params",
-        labels={"example": "optimization_loop", "type": "final_params"},
-        suggested_uri="./final_params.json", # under workspaces/artifacts/
-        pin=True,
-    )
-
-    metrics_path = pathlib.Path("./metrics.json")
-    metrics_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
-    saved_metrics = await artifacts.save(
-        str(metrics_path),
-        kind="optimization_metrics",
-        labels={"example": "optimization_loop", "type": "metrics"},
-        suggested_uri="./metrics.json", # under workspaces/artifacts/
-        pin=True,
+    saved_params, saved_metrics = await asyncio.gather(
+        artifacts.save_json(
+            final_params,
+            kind="optimization_params",
+            labels={"example": "optimization_loop", "type": "final_params"},
+            suggested_uri="./final_params.json", # under workspaces/artifacts/
+            pin=True,
+        ),
+        artifacts.save_json(
+            metrics,
+            kind="optimization_metrics",
+            labels={"example": "optimization_loop", "type": "metrics"},
+            suggested_uri="./metrics.json", # under workspaces/artifacts/
+            pin=True,
+        ),
     )
 
     await chan.send_text(
         "✅ Optimization finished.\n"
         f"Final params: x={params.x:.3f}, y={params.y:.3f}\n"
-        f"Final loss: {metrics[-1]['loss']:.6f}\n"
+        f"Final loss: {metrics['loss'][-1]:.6f}\n"
         f"Params artifact: {saved_params.uri}\n"
         f"Metrics artifact: {saved_metrics.uri}"
     )
@@ -226,7 +263,7 @@ async def optimization_loop(
 
     return {
         "final_params": final_params,
-        "final_loss": metrics[-1]["loss"],
+        "final_loss": metrics["loss"][-1],
         "metrics": metrics,
         "params_artifact_uri": saved_params.uri,
         "metrics_artifact_uri": saved_metrics.uri,
@@ -239,7 +276,7 @@ async def optimization_loop(
 
 @graph_fn(name="optimization_summary")
 async def optimization_summary(
-    metrics: List[Dict[str, float]],
+    metrics: Dict[str, List[float]],
     *,
     context: NodeContext,
 ):
@@ -248,9 +285,9 @@ async def optimization_summary(
 
     Inputs
     ------
-    metrics : List[dict]
-        A list of per-step records, each containing:
-          - "step", "x", "y", "loss", ...
+    metrics : Dict[str, List[float]]
+        Per-step metrics stored column-wise, with (at least) the columns:
+          - "step", "x", "y", "loss"
 
     Behavior
     --------
@@ -265,9 +302,10 @@ async def optimization_summary(
     chan = context.channel()
     artifacts = context.artifacts()
     llm = context.llm()
-    mem = context.memory()
+    mem = context.memory()  # only needed for the optional reconstruction below
 
-    logger.info("optimization_summary started with %d metrics points", len(metrics))
+    losses: List[float] = metrics.get("loss", [])
+    logger.info("optimization_summary started with %d metrics points", len(losses))
 
     # OPTIONAL: if you didn't pass metrics in, you could reconstruct them
     # from memory:
@@ -280,22 +318,21 @@ async def optimization_summary(
     #             metrics_from_mem.append(json.loads(evt.text))
     #         except Exception:
     #             pass
-    # # Then use metrics_from_mem instead of `metrics`.
+    # # Then convert to columns and use them instead of `metrics`:
+    # # {k: [m[k] for m in metrics_from_mem] for k in ("step", "x", "y", "loss")}
     #
     # For this example we keep `metrics` as the primary input and use memory
     # mainly as a logging mechanism in the loop.
 
-    if not metrics:
+    if not losses:
         await chan.send_text("No metrics provided; nothing to summarize.")
         return {"summary": "No metrics."}
 
-    losses = [m["loss"] for m in metrics]
-    steps = [m["step"] for m in metrics]
-
-    initial_loss = losses[0]
-    final_loss = losses[-1]
-    best_loss = min(losses)
-    best_step = steps[losses.index(best_loss)]
+    initial_loss = float(losses[0])
+    final_loss = float(losses[-1])
+    i_best = min(range(len(losses)), key=losses.__getitem__)  # single pass: best value and its position
+    best_loss = float(losses[i_best])
+    best_step = metrics["step"][i_best]
 
     # Use ArtifactFacade.best(...) to find the best checkpoint artifact
     # by minimum loss within this run.
@@ -310,21 +347,18 @@ async def optimization_summary(
 
     # Build a compact textual trajectory: sample a few steps for the prompt.
     max_points = 10
-    if len(metrics) <= max_points:
-        sampled = metrics
+    if len(losses) <= max_points:
+        indices = range(len(losses))
     else:
-        indices = [
-            int(round(i * (len(metrics) - 1) / (max_points - 1)))
-            for i in range(max_points)
-        ]
-        sampled = [metrics[i] for i in indices]
-
-    trajectory_lines = []
-    for m in sampled:
-        trajectory_lines.append(
-            f"step={m['step']}, x={m['x']:.3f}, y={m['y']:.3f}, loss={m['loss']:.6f}"
-        )
-    trajectory_text = "\n".join(trajectory_lines)
+        # Evenly spaced, strictly increasing indices (first and last step included).
+        last = len(losses) - 1
+        indices = [round(j * last / (max_points - 1)) for j in range(max_points)]
+
+    steps, xs, ys = metrics["step"], metrics["x"], metrics["y"]
+    trajectory_text = "\n".join(
+        f"step={steps[i]}, x={xs[i]:.3f}, y={ys[i]:.3f}, loss={losses[i]:.6f}"
+        for i in indices
+    )
 
     prompt = (
         "You are an expert at analyzing optimization and training runs.\n"
@@ -362,13 +396,9 @@ async def optimization_summary(
         ]
     )
 
-    # Save summary as an artifact (we could also use save_text, but keep it
-    # consistent with the rest of the example).
-    summary_path = pathlib.Path("./optimization_summary.txt")
-    summary_path.write_text(summary_text, encoding="utf-8")
-
-    saved_summary = await artifacts.save(
-        str(summary_path),
+    # Save summary as an artifact straight from memory (no local temp file).
+    saved_summary = await artifacts.save_text(
+        summary_text,
         kind="optimization_summary",
         labels={"example": "optimization_loop", "type": "summary"},
         suggested_uri="./optimization_summary.txt", # under workspaces/artifacts/
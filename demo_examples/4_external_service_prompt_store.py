@@ -34,8 +34,11 @@ This pattern enables non-engineers to update prompts and provides centralized ob
 
 from __future__ import annotations
 
+import string
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from aethergraph import graph_fn, NodeContext
 from aethergraph.core.runtime.base_service import Service
@@ -46,6 +49,31 @@ from aethergraph.core.runtime.runtime_services import register_context_service
 # 1) Define services
 # ---------------------------------------------------------
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format-style template once and return a `render(**fields)` function.
+
+    Plain "{name}" fields are filled with a simple join at call time, so the
+    template string is not re-parsed on every call. Templates that use format
+    specs, conversions or attribute/index access fall back to str.format_map.
+    """
+    pieces: List[Tuple[str, Optional[str]]] = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        if name is not None and (spec or conversion or not name.isidentifier()):
+            return lambda **fields: template.format_map(fields)
+        pieces.append((literal, name))
+
+    def render(**fields: Any) -> str:
+        out = []
+        for literal, name in pieces:
+            out.append(literal)
+            if name is not None:
+                out.append(format(fields[name]))
+        return "".join(out)
+
+    return render
+
+
 @dataclass
 class PromptStoreService(Service):
     """
@@ -53,23 +81,46 @@ class PromptStoreService(Service):
 
     Prompts are keyed by (agent_name, version).
     'latest' is resolved via `latest_versions`.
+    Lookups are memoized per (agent_name, requested_version); registering a
+    prompt drops the cached entries for that agent.
+    Templates are also precompiled at registration; use get_prompt_formatter()
+    to get a `render(**fields)` function instead of calling template.format().
     """
 
     prompts: Dict[str, Dict[str, str]] = field(default_factory=dict)
     latest_versions: Dict[str, str] = field(default_factory=dict)
+    _resolved: Dict[Tuple[str, str], str] = field(default_factory=dict, repr=False)
+    _compiled: Dict[Tuple[str, str], Callable[..., str]] = field(default_factory=dict, repr=False)
 
     def register_prompt(self, agent_name: str, version: str, template: str, *, is_latest: bool = True) -> None:
         self.prompts.setdefault(agent_name, {})[version] = template
+        self._compiled[(agent_name, version)] = _compile_template(template)
         if is_latest or agent_name not in self.latest_versions:
             self.latest_versions[agent_name] = version
+        self._resolved = {k: v for k, v in self._resolved.items() if k[0] != agent_name}
 
     def get_prompt(self, agent_name: str, version: str = "latest") -> str:
+        key = (agent_name, version)
+        template = self._resolved.get(key)
+        if template is not None:
+            return template
+
         if version == "latest":
             version = self.latest_versions.get(agent_name, "default")
         agent_prompts = self.prompts.get(agent_name, {})
         if version not in agent_prompts:
             raise KeyError(f"No prompt found for agent={agent_name!r}, version={version!r}")
-        return agent_prompts[version]
+        template = self._resolved[key] = agent_prompts[version]
+        return template
+
+    def get_prompt_formatter(self, agent_name: str, version: str = "latest") -> Callable[..., str]:
+        """Like get_prompt(), but returns the precompiled `render(**fields)` function."""
+        if version == "latest":
+            version = self.latest_versions.get(agent_name, "default")
+        try:
+            return self._compiled[(agent_name, version)]
+        except KeyError:
+            raise KeyError(f"No prompt found for agent={agent_name!r}, version={version!r}") from None
 
 
 @dataclass
@@ -81,9 +132,21 @@ class LLMObserverService(Service):
       - stream JSON to a file,
       - push to a logging/metrics system,
       - write to a database, etc.
+
+    `records` is a ring buffer: once `max_records` entries are stored, the
+    oldest ones are dropped, so a long-lived process doesn't grow without bound.
+    `writes_total` keeps counting every call, including the dropped ones.
+
+    `record()` is just a deque append, so it never blocks the calling agent and
+    `records` is up to date as soon as it returns.
     """
 
-    records: List[Dict[str, Any]] = field(default_factory=list)
+    max_records: int = 10_000
+    records: Deque[Dict[str, Any]] = field(init=False, repr=False)
+    writes_total: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.records = deque(maxlen=self.max_records)
 
     def record(
         self,
@@ -98,14 +161,12 @@ class LLMObserverService(Service):
             "prompt": prompt,
             "response": response,
             "tags": tags or {},
+            # Previews are sliced once here instead of on every print.
+            "prompt_preview": prompt[:60],
+            "response_preview": response[:60],
         }
         self.records.append(entry)
-
-        # For the example we just print a short line:
-        print(
-            f"[LLMObserver] agent={agent_name}, tags={entry['tags']}, "
-            f"prompt_preview={prompt[:60]!r}, response_preview={response[:60]!r}"
-        )
+        self.writes_total += 1
 
 
 
@@ -119,7 +180,7 @@ async def support_agent(question: str, *, context: NodeContext):
     """
     Support-style agent:
 
-    - Fetches its template from the prompt store.
+    - Fetches its template and system prompt from the prompt store.
     - Fills in the user question.
     - Calls the LLM.
     - Records the call via the LLM observer.
@@ -131,12 +192,13 @@ async def support_agent(question: str, *, context: NodeContext):
 
     logger.info("support_agent started with question=%r", question)
 
-    template = prompt_store.get_prompt("support_agent", version="latest")
-    prompt = template.format(question=question)
+    render = prompt_store.get_prompt_formatter("support_agent", version="latest")
+    prompt = render(question=question)
+    system_prompt = prompt_store.get_prompt("support_agent_system")
 
     response, usage = await llm.chat(
         messages=[
-            {"role": "system", "content": "You are a helpful support assistant."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt},
         ]
     )
@@ -174,12 +236,13 @@ async def analysis_agent(text: str, *, context: NodeContext):
 
     logger.info("analysis_agent started")
 
-    template = prompt_store.get_prompt("analysis_agent", version="latest")
-    prompt = template.format(text=text)
+    render = prompt_store.get_prompt_formatter("analysis_agent", version="latest")
+    prompt = render(text=text)
+    system_prompt = prompt_store.get_prompt("analysis_agent_system")
 
     response, usage = await llm.chat(
         messages=[
-            {"role": "system", "content": "You are a precise analytical assistant."},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt},
         ]
     )
@@ -252,6 +315,18 @@ if __name__ == "__main__":
         is_latest=True,
     )
 
+    # System prompts live in the same store, under "<agent>_system".
+    PROMPT_STORE.register_prompt(
+        agent_name="support_agent_system",
+        version="v1",
+        template="You are a helpful support assistant.",
+    )
+    PROMPT_STORE.register_prompt(
+        agent_name="analysis_agent_system",
+        version="v1",
+        template="You are a precise analytical assistant.",
+    )
+
     # --- Demo inputs ---
     user_question = "How can I start migrating my existing Python scripts to AetherGraph?"
     sample_text = (
@@ -269,11 +344,17 @@ if __name__ == "__main__":
     print("\n=== Analysis Agent Output ===")
     print(analysis_result["analysis"])
 
-    # --- Observer summary ---
-    print("\n=== LLM Observer Records ===")
-    print(f"Total recorded calls: {len(LLM_OBSERVER.records)}")
-    for rec in LLM_OBSERVER.records:
-        print(
-            f"- agent={rec['agent_name']}, tags={rec['tags']}, "
-            f"prompt≈{rec['prompt'][:40]!r}, response≈{rec['response'][:40]!r}"
-        )
+    # --- Observer summary (built once, written in a single call) ---
+    report = "\n".join(
+        [
+            "\n=== LLM Observer Records ===",
+            f"Total recorded calls: {LLM_OBSERVER.writes_total} "
+            f"(showing the last {len(LLM_OBSERVER.records)})",
+            *(
+                f"- agent={rec['agent_name']}, tags={rec['tags']}, "
+                f"prompt≈{rec['prompt_preview']!r}, response≈{rec['response_preview']!r}"
+                for rec in LLM_OBSERVER.records
+            ),
+        ]
+    )
+    sys.stdout.write(report + "\n")
@@ -31,63 +31,274 @@ Key features:
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import contextlib
+import hashlib
+import json
+import operator
+import os
 import re
-from typing import Literal
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Tuple
 
 from aethergraph import graph_fn, NodeContext
 
 
+# Cheap local routing for the obvious cases; only ambiguous queries reach the LLM.
+_MATH_RE = re.compile(r"[\s(]*\d[\d\s+\-*/().]*")
+# Only a leading imperative counts ("summarize this: ..."); questions that merely
+# mention the word ("how do I summarize a DataFrame?") go to the classifier.
+_SUMMARIZE_RE = re.compile(r"\s*(?:please\s+)?(?:summari[sz]e|tl;?dr|shorten|condense)\b", re.IGNORECASE)
+
+# Classifier decisions are cached per normalized query, so a repeated question
+# skips the routing LLM round-trip. Bounded LRU with a TTL to limit staleness.
+# The cache is saved under ./.ckpt at the end of a session and reloaded by the
+# next one, so a fresh process starts warm.
+CLASSIFY_CACHE_SIZE = 512
+CLASSIFY_CACHE_TTL_S = 3600.0
+CLASSIFY_CACHE_PATH = os.path.join(os.getcwd(), ".ckpt", "classifier_cache.json")
+_classify_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
+def _query_fingerprint(query: str) -> str:
+    """Case- and whitespace-insensitive fingerprint of a query."""
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_classify_cache(path: str = CLASSIFY_CACHE_PATH) -> None:
+    """Warm `_classify_cache` from a previous session; a missing or unreadable file is ignored."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        now = time.time()
+        for key, (mode, stored_at) in entries.items():
+            if now - stored_at < CLASSIFY_CACHE_TTL_S:
+                _classify_cache[key] = (mode, stored_at)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return
+    while len(_classify_cache) > CLASSIFY_CACHE_SIZE:
+        _classify_cache.popitem(last=False)
+
+
+def _save_classify_cache(path: str = CLASSIFY_CACHE_PATH) -> None:
+    """Write `_classify_cache` (in LRU order) atomically via a temp file + rename."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_classify_cache, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+# Fixed prompts, built once. Every call sends a byte-identical static prefix
+# (system message first, per-query content last), which lets providers with
+# prompt caching reuse the prefilled prefix across turns.
+_ROUTER_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a routing assistant for a copilot.\n\n"
+    "Given the user's message, choose exactly ONE of these modes:\n"
+    "  - calculator    (if the user asks to compute a math expression)\n"
+    "  - summarize     (if the user asks you to summarize a piece of text)\n"
+    "  - direct_answer (for everything else: questions, instructions, etc.)\n\n"
+    "Respond with exactly one word: calculator, summarize, or direct_answer.",
+}
+_SUMMARIZER_SYSTEM_MSG = {"role": "system", "content": "You summarize text clearly and concisely."}
+_ASSISTANT_SYSTEM_MSG = {"role": "system", "content": "You are a helpful, concise assistant."}
+_SUMMARIZE_INSTRUCTIONS = (
+    "Summarize the following text in 2–3 sentences. "
+    "Focus on the key ideas and keep it clear for a non-expert.\n\n"
+)
+
+
 # ---------------------------------------------------------
 # 1) Helper tools
 # ---------------------------------------------------------
 
+# Arithmetic the calculator understands; any other syntax is rejected.
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_MAX_POW_BITS = 100_000  # bound on integer ** results; 2**200 is fine, 9**9**9 is not
+
+# Byte sets to delete when filtering text down to an arithmetic expression.
+# All allowed characters are ASCII, so filtering is encode(ascii, ignore) +
+# bytes.translate, one C-level pass each, instead of a per-character generator.
+_CALC_DROP = bytes(b for b in range(256) if chr(b) not in "0123456789+-*/(). ")
+_EXPR_DROP = bytes(b for b in range(256) if chr(b) not in "0123456789+-*/().")
+
+
+def _keep_only(text: str, drop: bytes) -> str:
+    return text.encode("ascii", "ignore").translate(None, drop).decode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse once per distinct expression string."""
+    return ast.parse(expression, mode="eval").body
+
+
+def _eval_node(node: ast.expr) -> float:
+    """Evaluate a parsed arithmetic expression (numbers and + - * / // ** only)."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        left, right = _eval_node(node.left), _eval_node(node.right)
+        if (
+            isinstance(node.op, ast.Pow)
+            and isinstance(left, int)
+            and isinstance(right, int)
+            and abs(left) > 1
+            and abs(left).bit_length() * right > _MAX_POW_BITS
+        ):
+            raise ValueError("result too large")
+        return _BIN_OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError("unsupported syntax")
+
+
 async def calculate(expression: str) -> str:
     """
     Very small "calculator" tool.
 
     For demo purposes, only allows digits, spaces, and + - * / ( ).
-    This is NOT a production-safe evaluator; it's just enough to
-    show tool routing and keep the example self-contained.
+    The expression is parsed with `ast` and evaluated by a small walker that
+    only knows numbers and arithmetic operators (no `eval`).
     """
-    allowed = set("0123456789+-*/(). ")
-    filtered = "".join(ch for ch in expression if ch in allowed)
+    filtered = _keep_only(expression, _CALC_DROP)
 
     if not filtered.strip():
         return "[Calculator] I couldn't find a valid expression."
 
     try:
-        # We deliberately use a restricted eval environment.
-        result = eval(filtered, {"__builtins__": {}}, {})
+        result = _eval_node(_parse_expression(filtered))
         return f"[Calculator] {filtered} = {result}"
     except Exception as exc:
         return f"[Calculator] Error evaluating expression {filtered!r}: {exc}"
 
 
-async def summarize_text(text: str, context: NodeContext) -> str:
+async def summarize_text(text: str, context: NodeContext, llm=None) -> str:
     """
     Summarizer tool: calls the LLM via context.llm() to produce a short summary.
+    Pass `llm` to reuse an already-resolved handle.
     """
-    llm = context.llm()
-    prompt = (
-        "Summarize the following text in 2–3 sentences. "
-        "Focus on the key ideas and keep it clear for a non-expert.\n\n"
-        f"Text:\n{text}"
-    )
-
-    summary, _usage = await llm.chat(
-        messages=[
-            {"role": "system", "content": "You summarize text clearly and concisely."},
-            {"role": "user", "content": prompt},
-        ]
-    )
+    llm = llm or context.llm()
+    summary, _usage = await llm.chat(messages=_summary_messages(text))
     return summary
 
 
+def _summary_messages(text: str) -> List[Dict[str, Any]]:
+    return [
+        _SUMMARIZER_SYSTEM_MSG,
+        {"role": "user", "content": f"{_SUMMARIZE_INSTRUCTIONS}Text:\n{text}"},
+    ]
+
+
+def _direct_messages(query: str) -> List[Dict[str, Any]]:
+    return [
+        _ASSISTANT_SYSTEM_MSG,
+        {"role": "user", "content": query},
+    ]
+
+
+async def _generate_into(llm, messages: List[Dict[str, Any]], out: asyncio.Queue) -> None:
+    """
+    Generate an LLM reply into `out` chunk by chunk; None marks the end.
+
+    Uses llm.chat_stream() with an on_delta callback; if no deltas arrive
+    (provider without streaming), the full reply is queued as one chunk.
+    """
+    streamed = False
+
+    async def on_delta(chunk: str) -> None:
+        nonlocal streamed
+        streamed = True
+        out.put_nowait(chunk)
+
+    try:
+        reply, _usage = await llm.chat_stream(messages=messages, on_delta=on_delta)
+        if not streamed:
+            out.put_nowait(reply)
+    finally:
+        out.put_nowait(None)
+
+
+def _start_reply(llm, messages: List[Dict[str, Any]]) -> Tuple[asyncio.Task, asyncio.Queue]:
+    """Start generating a reply in the background; see `_relay_reply`."""
+    out: asyncio.Queue = asyncio.Queue()
+    return asyncio.create_task(_generate_into(llm, messages, out)), out
+
+
+async def _relay_reply(chan, header: str, reply: Tuple[asyncio.Task, asyncio.Queue]) -> str:
+    """
+    Stream a reply started by `_start_reply` to the channel as chunks arrive,
+    so the user sees the first tokens right away. Returns the full text.
+    """
+    task, out = reply
+    chunks = [header]
+    async with chan.stream() as s:
+        await s.delta(header)
+        while (chunk := await out.get()) is not None:
+            chunks.append(chunk)
+            await s.delta(chunk)
+        await task  # re-raise generation errors
+        text = "".join(chunks)
+        await s.end(full_text=text, memory_log=False)  # copilot replies aren't logged to memory
+    return text
+
+
 # ---------------------------------------------------------
 # 2) LLM-based router (classification)
 # ---------------------------------------------------------
 
-async def classify_query(query: str, context: NodeContext) -> Literal["calculator", "summarize", "direct_answer"]:
+_VALID_MODES = frozenset({"calculator", "summarize", "direct_answer"})
+
+# The router only needs one label back; cap generation so the model can't
+# spend time on a sentence we would throw away anyway.
+CLASSIFY_MAX_OUTPUT_TOKENS = 8
+
+
+def _parse_mode(raw: str) -> str | None:
+    """
+    Map the classifier's reply to a mode. Only the first word counts, so
+    padded or chatty replies like "Calculator." or "summarize: ..." still
+    route correctly; anything else (empty, truncated, off-script) gives None.
+    """
+    words = raw.split(maxsplit=1)
+    label = words[0].lower().rstrip(":.,!?") if words else ""
+    return label if label in _VALID_MODES else None
+
+
+def _route_without_llm(query: str) -> str | None:
+    """
+    Route `query` using only local checks: the regex fast-paths, then the
+    classifier cache. Returns None when the LLM classifier is needed.
+    """
+    if _MATH_RE.fullmatch(query):
+        return "calculator"
+    if _SUMMARIZE_RE.match(query):
+        return "summarize"
+
+    key = _query_fingerprint(query)
+    hit = _classify_cache.get(key)
+    if hit is not None and time.time() - hit[1] < CLASSIFY_CACHE_TTL_S:
+        _classify_cache.move_to_end(key)
+        return hit[0]
+    return None
+
+
+async def classify_query(
+    query: str, context: NodeContext, llm=None, *, skip_local: bool = False
+) -> Literal["calculator", "summarize", "direct_answer"]:
     """
     Ask the LLM to classify the user's query into one of three buckets:
 
@@ -96,29 +307,36 @@ async def classify_query(query: str, context: NodeContext) -> Literal["calculato
       - "direct_answer" → answer directly without tools.
 
     The model is instructed to ONLY reply with one of those labels.
+    Bare math expressions and explicit summarize requests are routed locally
+    without an LLM call; LLM decisions are cached by query fingerprint
+    (see `_route_without_llm`). Pass `llm` to reuse an already-resolved handle,
+    and `skip_local=True` if the caller already ran `_route_without_llm`.
     """
-    llm = context.llm()
+    if not skip_local:
+        local_mode = _route_without_llm(query)
+        if local_mode is not None:
+            return local_mode  # type: ignore[return-value]
 
-    system_prompt = (
-        "You are a routing assistant for a copilot.\n\n"
-        "Given the user's message, choose exactly ONE of these modes:\n"
-        "  - calculator    (if the user asks to compute a math expression)\n"
-        "  - summarize     (if the user asks you to summarize a piece of text)\n"
-        "  - direct_answer (for everything else: questions, instructions, etc.)\n\n"
-        "Respond with exactly one word: calculator, summarize, or direct_answer."
-    )
+    llm = llm or context.llm()
 
     classification, _usage = await llm.chat(
         messages=[
-            {"role": "system", "content": system_prompt},
+            _ROUTER_SYSTEM_MSG,
             {"role": "user", "content": query},
-        ]
+        ],
+        max_output_tokens=CLASSIFY_MAX_OUTPUT_TOKENS,
     )
 
-    mode = classification.strip().lower()
-    if mode not in ("calculator", "summarize", "direct_answer"):
-        # Fallback if the model does something unexpected
-        mode = "direct_answer"
+    mode = _parse_mode(classification)
+    if mode is None:
+        # No valid label: fall back without caching, so one bad reply doesn't pin the query.
+        return "direct_answer"
+
+    key = _query_fingerprint(query)
+    _classify_cache[key] = (mode, time.time())
+    _classify_cache.move_to_end(key)
+    if len(_classify_cache) > CLASSIFY_CACHE_SIZE:
+        _classify_cache.popitem(last=False)
 
     return mode  # type: ignore[return-value]
 
@@ -135,8 +353,7 @@ def extract_expression_from_query(query: str) -> str:
       "what is 2+3?" -> "2+3"
       "calculate (10 - 3) * 4 please" -> "(10-3)*4"
     """
-    allowed = set("0123456789+-*/().")
-    expr = "".join(ch for ch in query if ch in allowed)
+    expr = _keep_only(query, _EXPR_DROP)
     return expr or query
 
 
@@ -144,6 +361,28 @@ def extract_expression_from_query(query: str) -> str:
 # 3) Copilot graph function
 # ---------------------------------------------------------
 
+# Max routing records written per memory flush.
+MEMORY_FLUSH_BATCH = 16
+
+
+async def _memory_flusher(mem, queue: asyncio.Queue, logger) -> None:
+    """
+    Background writer for routing records: waits for the first queued record,
+    grabs whatever else is already queued (up to MEMORY_FLUSH_BATCH) and writes
+    the batch concurrently, so memory I/O never sits on the reply path.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < MEMORY_FLUSH_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        results = await asyncio.gather(*(mem.record(**rec) for rec in batch), return_exceptions=True)
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning("Failed to record routing event: %s", res)
+        for _ in batch:
+            queue.task_done()
+
+
 @graph_fn(name="simple_copilot")
 async def simple_copilot(*, context: NodeContext):
     """
@@ -163,57 +402,94 @@ async def simple_copilot(*, context: NodeContext):
     """
     logger = context.logger()
     chan = context.channel()
+    mem = context.memory()
+    llm = context.llm()
 
     logger.info("simple_copilot started")
 
-    await chan.send_text(
-        "🧭 Simple Copilot ready.\n"
-        "I can answer questions, do quick math, or summarize text.\n"
-        "Type 'quit' or 'exit' to stop."
-    )
+    # Reuse classifier decisions from earlier sessions (unless the launcher
+    # already loaded them, see the demo runner below).
+    if not _classify_cache:
+        await asyncio.to_thread(_load_classify_cache)
 
-    while True:
-        query = await chan.ask_text("You:")
-        if not query:
-            await chan.send_text("No input received. Type 'quit' to exit.")
-            continue
-
-        if query.strip().lower() in ("quit", "exit"):
-            await chan.send_text("👋 Copilot session ended. Bye!")
-            logger.info("simple_copilot ended by user request.")
-            break
-
-        # Decide which mode to use
-        mode = await classify_query(query, context)
-        logger.info("Router classified query as mode=%s", mode)
-
-        # Optional: log to memory or artifacts (pseudo-code; adjust to your API)
-        mem = context.memory()  # type: ignore[attr-defined]
-        await mem.record(
-            kind="copilot_routing",
-            data={"query": query, "mode": mode},
-        )
+    # Routing records are queued and written by a background flusher.
+    record_queue: asyncio.Queue = asyncio.Queue()
+    flusher = asyncio.create_task(_memory_flusher(mem, record_queue, logger))
 
+    try:
+        await chan.send_text(
+            "🧭 Simple Copilot ready.\n"
+            "I can answer questions, do quick math, or summarize text.\n"
+            "Type 'quit' or 'exit' to stop."
+        )
 
-        # Route to tools / direct answer
-        if mode == "calculator":
-            expr = extract_expression_from_query(query)
-            result = await calculate(expr)
-            await chan.send_text(f"🧮 Calculator mode\n{result}")
+        while True:
+            query = await chan.ask_text("You:")
+            # Whitespace-only input counts as empty, so it never reaches the classifier.
+            if not query or query.isspace():
+                await chan.send_text("No input received. Type 'quit' to exit.")
+                continue
+
+            if query.strip().lower() in ("quit", "exit"):
+                await chan.send_text("👋 Copilot session ended. Bye!")
+                logger.info("simple_copilot ended by user request.")
+                break
+
+            # Decide which mode to use. If that needs the LLM classifier, start the
+            # direct answer (the most common route) speculatively in parallel and
+            # cancel it if the query is routed elsewhere.
+            direct_reply: Tuple[asyncio.Task, asyncio.Queue] | None = None
+            mode = _route_without_llm(query)
+            if mode is None:
+                direct_reply = _start_reply(llm, _direct_messages(query))
+                try:
+                    mode = await classify_query(query, context, llm=llm, skip_local=True)
+                finally:
+                    if mode != "direct_answer":
+                        direct_reply[0].cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await direct_reply[0]
+                        direct_reply = None
+            logger.info("Router classified query as mode=%s", mode)
+
+            # Log the routing decision to memory (written in the background).
+            record_queue.put_nowait(
+                {
+                    "kind": "copilot_routing",
+                    "data": {"query": query, "mode": mode},
+                }
+            )
 
-        elif mode == "summarize":
-            summary = await summarize_text(query, context)
-            await chan.send_text("📝 Summary mode\n" + summary)
+            # Route to tools / direct answer
+            if mode == "calculator":
+                expr = extract_expression_from_query(query)
+                result = await calculate(expr)
+                await chan.send_text(f"🧮 Calculator mode\n{result}")
+
+            # LLM replies are streamed to the channel as they are generated.
+            elif mode == "summarize":
+                await _relay_reply(chan, "📝 Summary mode\n", _start_reply(llm, _summary_messages(query)))
+
+            else:  # "direct_answer"
+                await _relay_reply(
+                    chan,
+                    "💬 Direct answer mode\n",
+                    direct_reply or _start_reply(llm, _direct_messages(query)),
+                )
+    finally:
+        # Make sure every queued routing record is written before we return,
+        # even if the chat loop raised, then stop the flusher.
+        if not flusher.done():
+            await record_queue.join()
+        flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flusher
 
-        else:  # "direct_answer"
-            llm = context.llm()
-            answer, _usage = await llm.chat(
-                messages=[
-                    {"role": "system", "content": "You are a helpful, concise assistant."},
-                    {"role": "user", "content": query},
-                ]
-            )
-            await chan.send_text("💬 Direct answer mode\n" + answer)
+    try:
+        await asyncio.to_thread(_save_classify_cache)
+    except OSError as e:
+        # The cache is only an optimization; a read-only or full disk shouldn't fail the session.
+        logger.warning("Failed to save classifier cache: %s", e)
 
     logger.info("simple_copilot finished")
     return {"status": "finished"}
@@ -224,12 +500,20 @@ async def simple_copilot(*, context: NodeContext):
 # ---------------------------------------------------------
 
 if __name__ == "__main__":
+    import threading
+
     from aethergraph import start_server
     from aethergraph.runner import run
 
+    # Warm the classifier cache from disk while the sidecar boots, so neither
+    # waits on the other.
+    cache_loader = threading.Thread(target=_load_classify_cache, daemon=True)
+    cache_loader.start()
+
     # Start sidecar so context.llm(), context.channel(), etc. are available.
     url = start_server(port=0)
     print("AetherGraph sidecar server started at:", url)
+    cache_loader.join()
 
     # Run the copilot once. It'll keep interacting on the console
     # until the user types 'quit' or 'exit'.
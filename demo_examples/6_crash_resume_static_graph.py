@@ -11,7 +11,7 @@ Defines a 3-node static graph (@graphify):
     combine_3 - Combines results from both nodes
 
 Checkpoint mechanism:
-    resumable_2 saves its state {i, acc} to ./.ckpt/<run_id>__resumable_2.json every 8 iterations
+    resumable_2 saves its state (i, acc) to ./.ckpt/<run_id>__resumable_2.ckpt every 8 iterations
     On restart with the same run_id, it loads the checkpoint and continues from where it left off
 
 Crash simulation (two options):
@@ -56,8 +56,8 @@ from __future__ import annotations
 
 import os
 import sys
-import json
 import asyncio
+import struct
 import time
 from typing import Dict, Any
 
@@ -72,18 +72,47 @@ def now() -> str:
     return f"{time.perf_counter():.3f}s"
 
 
-# ---------- checkpoint helper ----------
+# ---------- checkpoint helpers ----------
+
+# A checkpoint is one fixed-width record (i, acc) at offset 0 of the file, so
+# saving it is a single in-place write on an fd kept open for the whole node.
+_CKPT_RECORD = struct.Struct("<QQ")
+
 
 def _ckpt_path(run_id: str, node_id: str) -> str:
     """
     Compute a checkpoint path for a given (run_id, node_id) pair.
 
     We store checkpoints under ./.ckpt so multiple runs can coexist:
-      ./.ckpt/<run_id>__<node_id>.json
+      ./.ckpt/<run_id>__<node_id>.ckpt
     """
     d = os.path.join(os.getcwd(), ".ckpt")
     os.makedirs(d, exist_ok=True)
-    return os.path.join(d, f"{run_id}__{node_id}.json")
+    return os.path.join(d, f"{run_id}__{node_id}.ckpt")
+
+
+def _read_at_start(fd: int, size: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, 0)
+    os.lseek(fd, 0, os.SEEK_SET)  # Windows has no pread/pwrite
+    return os.read(fd, size)
+
+
+def _write_at_start(fd: int, data: bytes) -> None:
+    if hasattr(os, "pwrite"):
+        os.pwrite(fd, data, 0)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, data)
+
+
+# Iterations between checkpoints in resumable_work.
+CKPT_EVERY = 8
+
+
+async def _simulated_io_step() -> None:
+    """Stand-in for one iteration's real (I/O-bound) work."""
+    await asyncio.sleep(0.3)
 
 
 # ---------- tools (nodes) ----------
@@ -105,7 +134,7 @@ async def resumable_work(n: int = 40, *, context: NodeContext) -> Dict[str, Any]
 
     It simulates work in a loop:
       - Uses (run_id, node_id) from NodeContext to find its checkpoint file.
-      - On each checkpoint, saves {"i": current_iteration, "acc": accumulator}.
+      - On each checkpoint, saves (current_iteration, accumulator) as a fixed-width record.
       - On restart (same run_id), it loads the checkpoint and continues
         instead of starting from i = 0.
 
@@ -119,37 +148,46 @@ async def resumable_work(n: int = 40, *, context: NodeContext) -> Dict[str, Any]
     run_id, node_id = context.run_id, context.node_id
     path = _ckpt_path(run_id, node_id)
 
-    # Load checkpoint if it exists
-    state = {"i": 0, "acc": 0}
-    if os.path.exists(path):
-        try:
-            state = json.load(open(path, "r", encoding="utf-8"))
-            print(f"[{now()}] {node_id} loaded ckpt:", state)
-        except Exception:
+    # Open the checkpoint file once; it stays open for all checkpoint writes.
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        # Load checkpoint if it exists
+        i, acc = 0, 0
+        raw = _read_at_start(fd, _CKPT_RECORD.size)
+        if len(raw) == _CKPT_RECORD.size:
+            i, acc = _CKPT_RECORD.unpack(raw)
+            print(f"[{now()}] {node_id} loaded ckpt:", {"i": i, "acc": acc})
+        elif raw:
             print(f"[{now()}] {node_id} ckpt unreadable; starting fresh")
 
-    i, acc = int(state["i"]), int(state["acc"])
-
-    # Optional crash-once for demo: set CRASH_AT to an iteration index
-    crash_at_env = os.getenv("CRASH_AT")
-    crash_at = int(crash_at_env) if crash_at_env and crash_at_env.isdigit() else None
-
-    while i < n:
-        # Pretend this loop is real work
-        await asyncio.sleep(0.3)
-        acc += i
-        i += 1
-
-        # Checkpoint every few steps (or at the end)
-        if i % 8 == 0 or i == n:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({"i": i, "acc": acc}, f)
-            print(f"[{now()}] {node_id} ckpt ->", {"i": i, "acc": acc})
-
-        # Simulate crash at a chosen iteration
-        if crash_at is not None and i == crash_at:
-            print(f"[{now()}] {node_id} simulating crash at i={i}")
-            raise RuntimeError("Simulated failure")
+        # Optional crash-once for demo: set CRASH_AT to an iteration index
+        crash_at_env = os.getenv("CRASH_AT")
+        crash_at = int(crash_at_env) if crash_at_env and crash_at_env.isdigit() else None
+
+        while i < n:
+            # Work in chunks up to the next checkpoint (or the end, or the crash
+            # point). Per-iteration work is just the simulated I/O; the
+            # accumulator update for the whole chunk, sum(range(i, j)), is one
+            # closed-form expression instead of a Python-level `acc += i` loop.
+            j = min(n, (i // CKPT_EVERY + 1) * CKPT_EVERY)
+            if crash_at is not None and i < crash_at < j:
+                j = crash_at
+            for _ in range(i, j):
+                await _simulated_io_step()
+            acc += (i + j - 1) * (j - i) // 2
+            i = j
+
+            # Checkpoint every few steps (or at the end): one in-place write.
+            if i % CKPT_EVERY == 0 or i == n:
+                _write_at_start(fd, _CKPT_RECORD.pack(i, acc))
+                print(f"[{now()}] {node_id} ckpt ->", {"i": i, "acc": acc})
+
+            # Simulate crash at a chosen iteration
+            if crash_at is not None and i == crash_at:
+                print(f"[{now()}] {node_id} simulating crash at i={i}")
+                raise RuntimeError("Simulated failure")
+    finally:
+        os.close(fd)
 
     # Optional cleanup once finished
     # os.remove(path)
@@ -270,7 +308,7 @@ if __name__ == "__main__":
     #         python demo_restart_minimal.py run-abc12345
     #
     #   Now resumable_2 will:
-    #     - load its checkpoint from ./.ckpt/run-abc12345__resumable_2.json
+    #     - load its checkpoint from ./.ckpt/run-abc12345__resumable_2.ckpt
     #     - continue from the saved (i, acc)
     #     - finish the remaining iterations instead of starting at 0
     #
@@ -28,25 +28,31 @@ from aethergraph.runtime import (
     set_default_channel,
     set_channel_alias,
 )
+import asyncio
 import os 
 
 # example graph_fn
 @graph_fn(name="test_channel_service")
 async def test_channel_service(context: NodeContext):
-    channel = context.channel() # default channel set in main
-    await channel.send_text("Hello from Aethergraph via Slack channel!")
+    default_channel = context.channel() # default channel set in main
+    slack_channel = context.channel("my_slack") # use alias; to be set in main
+    telegram_channel = context.channel("my_telegram") # use alias; to be set in main
 
-    channel = context.channel("my_slack") # use alias; to be set in main
-    await channel.send_text("Hello again via my_slack alias!")
+    async def _send_slack():
+        # default and my_slack are the same Slack channel here, so keep these two in order
+        await default_channel.send_text("Hello from Aethergraph via Slack channel!")
+        await slack_channel.send_text("Hello again via my_slack alias!")
 
-    channel = context.channel("my_telegram") # use alias; to be set in main
-    await channel.send_text("Hello via my_telegram alias!")
+    # Telegram is a separate channel, so its send overlaps with the Slack ones.
+    await asyncio.gather(
+        _send_slack(),
+        telegram_channel.send_text("Hello via my_telegram alias!"),
+    )
     return {"status": "message sent"}
 
 
 if __name__ == "__main__":
     from aethergraph.runner import run_async
-    import asyncio
 
     # typical usage: set up channel service with multiple channels and aliases
     SLACK_TEAM_ID = os.getenv("SLACK_TEAM_ID", "your-slack-team-id")
@@ -48,34 +48,50 @@ from aethergraph import Button # import Button class for link buttons in channel
 
 import random
 import io
-import csv
 import time
 import zipfile
 import asyncio
-from typing import Dict, Any
-import matplotlib.pyplot as plt
+from typing import Dict, Any, Optional
+import numpy as np
 
 # Tools for easy plotting and file handling
 # ----- send image ----- 
+_PLT = None
+
+def _plt():
+    """Import matplotlib.pyplot on first use, so graphs that never plot don't pay for it."""
+    global _PLT
+    if _PLT is None:
+        import matplotlib
+        matplotlib.use("Agg")  # render to PNG bytes only; skip GUI backend setup
+        import matplotlib.pyplot as plt
+        _PLT = plt
+    return _PLT
+
+# One (fig, ax) reused across chart calls; the lock keeps concurrent calls from drawing on it at once
+_FIG_CACHE: Optional[tuple] = None
+_FIG_LOCK = asyncio.Lock()
+
 @tool(outputs=["filename"], name="ch_send_price_chart", version="0.1.0")
 async def ch_send_price_chart(symbol: str, points: int = 60, *, context: NodeContext):
-    # Simulate price series
-    px = 100.0
-    xs, ys = [], []
-    for i in range(points):
-        px *= (1 + random.uniform(-0.005, 0.006))
-        xs.append(i)
-        ys.append(px)
+    # Simulate price series (random walk of per-tick returns)
+    xs = np.arange(points)
+    ys = 100.0 * np.cumprod(1 + np.random.uniform(-0.005, 0.006, size=points))
 
     # Plot to bytes
-    fig, ax = plt.subplots()
-    ax.plot(xs, ys)  # (frontend rule: no explicit colors/styles)
-    ax.set_title(f"{symbol} — Last {points} ticks")
-    ax.set_xlabel("t")
-    ax.set_ylabel("price")
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight")
-    plt.close(fig)
+    global _FIG_CACHE
+    async with _FIG_LOCK:
+        if _FIG_CACHE is None:
+            # fixed size + tight layout engine, so savefig needs no bbox_inches="tight" pass
+            _FIG_CACHE = _plt().subplots(figsize=(6, 4), layout="tight")
+        fig, ax = _FIG_CACHE
+        ax.clear()
+        ax.plot(xs, ys)  # (frontend rule: no explicit colors/styles)
+        ax.set_title(f"{symbol} — Last {points} ticks")
+        ax.set_xlabel("t")
+        ax.set_ylabel("price")
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png")
     png_bytes = buf.getvalue()
 
     # send as file (Slack: uploads; Console: prints link-ish line)
@@ -85,20 +101,25 @@ async def ch_send_price_chart(symbol: str, points: int = 60, *, context: NodeCon
 # ----- send CSV file and ZIP -----
 @tool(outputs=["zip_name"], name="ch_send_export_zip", version="0.1.0")
 async def ch_send_export_zip(symbol: str, rows: int = 50, *, context: NodeContext):
-    # create csv in memory
-    csv_buf = io.StringIO()
-    writer = csv.writer(csv_buf)
-    writer.writerow(["ts","symbol","price"])
-    price = 100.0
+    # create csv in memory; ts/price are numeric, and the symbol (user input) is
+    # the same on every row, so it is CSV-quoted once here if it needs it
+    prices = 100.0 * np.cumprod(1 + np.random.uniform(-0.003, 0.004, size=rows))
     ts0 = int(time.time())
-    for i in range(rows):
-        price *= (1 + random.uniform(-0.003, 0.004))
-        writer.writerow([ts0 - (rows - i)*5, symbol, f"{price:.4f}"])
-    csv_bytes = csv_buf.getvalue().encode("utf-8")
-
-    # Zip it
+    ts_col = ts0 - (rows - np.arange(rows)) * 5
+    sym_field = symbol
+    if any(c in symbol for c in ',"\r\n'):
+        sym_field = '"' + symbol.replace('"', '""') + '"'
+    lines = ["ts,symbol,price"]
+    lines.extend(f"{t},{sym_field},{p:.4f}" for t, p in zip(ts_col.tolist(), prices.tolist()))
+    csv_bytes = ("\n".join(lines) + "\n").encode("utf-8")
+
+    # Zip it (a few KB isn't worth deflating; larger exports use the fastest deflate level)
     zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    if len(csv_bytes) < 16 * 1024:
+        zip_opts = {"compression": zipfile.ZIP_STORED}
+    else:
+        zip_opts = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": 1}
+    with zipfile.ZipFile(zip_buf, "w", **zip_opts) as zf:
         zf.writestr(f"{symbol}_ticks.csv", csv_bytes)
     zbytes = zip_buf.getvalue()
 
@@ -119,12 +140,25 @@ async def ch_send_links(text: str, download_url: str, dashboard_url: str, *, con
 @tool(outputs=["final_text"], name="ch_stream_report", version="0.1.0")
 async def ch_stream_report(lines: int = 10, delay_s: float = 0.2, *, context: NodeContext):
     chunks = []
+    pending = []  # lines not yet sent; flushed as one delta every few lines or ~100ms
+    flush_s = 0.1
+    # Only coalesce when lines come faster than the flush interval; slower
+    # producers would flush every line anyway, so just send them straight away.
+    coalesce = delay_s < flush_s
+    loop = asyncio.get_running_loop()
     async with context.channel().stream() as s: 
+        last_flush = float("-inf")  # the first line always goes out immediately
         for i in range(lines):
             piece = f"• update {i+1}/{lines}: pnl={random.uniform(-1, 1):+.2f}%\n"
             chunks.append(piece)
-            await s.delta(piece)
+            pending.append(piece)
+            if not coalesce or len(pending) >= 8 or loop.time() - last_flush > flush_s:
+                await s.delta("".join(pending))
+                pending.clear()
+                last_flush = loop.time()
             await asyncio.sleep(delay_s)
+        if pending:
+            await s.delta("".join(pending))
         final = "".join(chunks)
         await s.end(full_text="Live report complete.\n" + final)
     return {"final_text": "Live report complete."} 
@@ -173,20 +207,17 @@ async def portfolio_channel_demo(*, context: NodeContext):
     else:
         await chan.send_text(f"Holding position on *{sym}*... (simulated)")
 
-    # Send a price chart image (simulated)
-    await chan.send_text(f"Generating price chart for *{sym}*...")
-    await ch_send_price_chart(symbol=sym) 
-
-    # Send CSV export as ZIP
-    await chan.send_text(f"Preparing data export for *{sym}*...")
-    await ch_send_export_zip(symbol=sym)
-
-    # Send link buttons
-    await chan.send_text(f"Here are some useful links for *{sym}*:")
-    await ch_send_links(
-        text=f"Choose an action for *{sym}*:",
-        download_url=f"https://example.com/downloads/{sym}_data.csv",
-        dashboard_url=f"https://example.com/dashboards/{sym}"
+    # Send a price chart image, the CSV export as ZIP, and link buttons (simulated).
+    # They don't depend on each other, so run them concurrently.
+    await chan.send_text(f"Generating price chart, data export, and useful links for *{sym}*...")
+    await asyncio.gather(
+        ch_send_price_chart(symbol=sym),
+        ch_send_export_zip(symbol=sym),
+        ch_send_links(
+            text=f"Choose an action for *{sym}*:",
+            download_url=f"https://example.com/downloads/{sym}_data.csv",
+            dashboard_url=f"https://example.com/dashboards/{sym}"
+        ),
     )
 
     # Stream a live report
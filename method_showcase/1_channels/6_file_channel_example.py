@@ -12,12 +12,16 @@ async def file_log_demo(*, context: NodeContext):
     # Choose a file channel key; everything after "file:" is relative to the adapter's root
     log_chan = context.channel("file:runs/demo_run.log")
 
-    await log_chan.send_text("=== Demo run started ===")
-    await log_chan.send_text("Running some imaginary steps...")
-    await log_chan.send_text("Step 1: loaded data ✅")
-    await log_chan.send_text("Step 2: trained model ✅")
-    await log_chan.send_text("Step 3: evaluated metrics ✅")
-    await log_chan.send_text("=== Demo run finished successfully 🎉 ===")
+    lines = [
+        "=== Demo run started ===",
+        "Running some imaginary steps...",
+        "Step 1: loaded data ✅",
+        "Step 2: trained model ✅",
+        "Step 3: evaluated metrics ✅",
+        "=== Demo run finished successfully 🎉 ===",
+    ]
+    # Buffer the lines and flush them in one send: one round-trip and one file append
+    await log_chan.send_text("\n".join(lines))
 
     return {"status": "ok"}
 
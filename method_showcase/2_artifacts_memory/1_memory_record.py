@@ -3,8 +3,6 @@
 from aethergraph import graph_fn, NodeContext
 from aethergraph import start_server 
 
-url = start_server(port=0)
-
 @graph_fn(name="memory_record_graph")
 async def memory_record_graph(context: NodeContext):
     """A simple graph that demonstrates memory recording and retrieval."""
@@ -56,14 +54,19 @@ async def memory_retrieve_graph(context: NodeContext):
 
 
 if __name__ == "__main__":
+    url = start_server(port=0) # start sidecar server at random port
+
     from aethergraph.runner import run_async
     import asyncio
     run_id = "tutorial_memory_record" # fixed run_id for demo purposes so memory is shared
 
-    print("Running memory_record_graph...")
-    result_record = asyncio.run(run_async(memory_record_graph, inputs={}, run_id=run_id))
-    print("memory_record_graph result:", result_record)
+    async def main():
+        print("Running memory_record_graph...")
+        result_record = await run_async(memory_record_graph, inputs={}, run_id=run_id)
+        print("memory_record_graph result:", result_record)
+
+        print("Running memory_retrieve_graph...")
+        result_retrieve = await run_async(memory_retrieve_graph, inputs={}, run_id=run_id)
+        print("memory_retrieve_graph result:", result_retrieve)
 
-    print("Running memory_retrieve_graph...")
-    result_retrieve = asyncio.run(run_async(memory_retrieve_graph, inputs={}, run_id=run_id))
-    print("memory_retrieve_graph result:", result_retrieve)
+    asyncio.run(main())
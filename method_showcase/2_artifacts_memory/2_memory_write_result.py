@@ -3,8 +3,6 @@
 from aethergraph import graph_fn, NodeContext
 from aethergraph import start_server 
 
-url = start_server(port=0)
-
 @graph_fn(name="write_memory_result_graph")
 async def write_memory_result_graph(*, context: NodeContext):
     """A simple graph that writes its result to memory."""
@@ -72,18 +70,23 @@ async def retrieve_last_calculation_result(*, context: NodeContext):
     }
 
 if __name__ == "__main__":
+    url = start_server(port=0) # start sidecar server at random port
+
     from aethergraph.runner import run_async
     import asyncio
     run_id = "tutorial_memory_write_result" # fixed run_id for demo purposes so memory is shared
 
-    print("Running write_memory_result_graph...")
-    result_write = asyncio.run(run_async(write_memory_result_graph, inputs={}, run_id=run_id))
-    print("Write result:", result_write)
+    async def main():
+        print("Running write_memory_result_graph...")
+        result_write = await run_async(write_memory_result_graph, inputs={}, run_id=run_id)
+        print("Write result:", result_write)
+
+        print("\nRunning read_memory_result_graph...")
+        result_read = await run_async(read_memory_result_graph, inputs={}, run_id=run_id)
+        print("Read result:", result_read)
 
-    print("\nRunning read_memory_result_graph...")
-    result_read = asyncio.run(run_async(read_memory_result_graph, inputs={}, run_id=run_id))
-    print("Read result:", result_read)
+        print("\nRunning retrieve_last_calculation_result...")
+        result_retrieve = await run_async(retrieve_last_calculation_result, inputs={}, run_id=run_id)
+        print("Retrieve last calculation result:", result_retrieve)
 
-    print("\nRunning retrieve_last_calculation_result...")
-    result_retrieve = asyncio.run(run_async(retrieve_last_calculation_result, inputs={}, run_id=run_id))
-    print("Retrieve last calculation result:", result_retrieve)
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
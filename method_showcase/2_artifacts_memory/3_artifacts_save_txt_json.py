@@ -3,8 +3,6 @@
 from aethergraph import graph_fn, NodeContext
 from aethergraph import start_server 
 
-url = start_server(port=0)
-
 @graph_fn(name="save_text_json")
 async def save_text_json(*, context: NodeContext):
     
@@ -55,14 +53,19 @@ async def retrieve_artifacts_by_uri(text_uri, json_uri, *, context: NodeContext)
 
 
 if __name__ == "__main__":
+    url = start_server(port=0) # start sidecar server at random port
+
     from aethergraph.runner import run_async
     import asyncio
     run_id = "tutorial_artifact_save" # fixed run_id for demo purposes so artifacts are stored consistently
-    print("Running save_text_json...")
-    uris = asyncio.run(run_async(save_text_json, run_id=run_id))
 
-    print("Result:", uris)
+    async def main():
+        print("Running save_text_json...")
+        uris = await run_async(save_text_json, run_id=run_id)
+
+        print("Result:", uris)
+
+        print("\nRunning retrieve_artifacts_by_uri...")
+        return await run_async(retrieve_artifacts_by_uri, inputs=uris, run_id=run_id)
 
-    print("\nRunning retrieve_artifacts_by_uri...")
-    contents = asyncio.run(
-        run_async(retrieve_artifacts_by_uri, inputs=uris, run_id=run_id))
+    contents = asyncio.run(main())
@@ -3,8 +3,6 @@
 from aethergraph import graph_fn, NodeContext
 from aethergraph import start_server 
 
-url = start_server(port=0)
-
 @graph_fn(name="save_image_file")
 async def save_image_file(*, context: NodeContext):
     arts = context.artifacts()
@@ -76,11 +74,17 @@ async def search_image_file( *, context: NodeContext):
     return {"found_count": len(results), "artifacts": [art.uri for art in results]}
 
 if __name__ == "__main__":
+    url = start_server(port=0) # start sidecar server at random port
+
     from aethergraph.runner import run_async
     import asyncio
     run_id = "tutorial_artifact_save_search_files" # fixed run_id for demo purposes so artifacts are stored consistently
-    print("Running save_image_file...")
-    uri = asyncio.run(run_async(save_image_file, run_id=run_id))
 
-    print("Running search_image_file...")
-    search_results = asyncio.run(run_async(search_image_file, run_id=run_id))
\ No newline at end of file
+    async def main():
+        print("Running save_image_file...")
+        uri = await run_async(save_image_file, run_id=run_id)
+
+        print("Running search_image_file...")
+        return await run_async(search_image_file, run_id=run_id)
+
+    search_results = asyncio.run(main())
\ No newline at end of file
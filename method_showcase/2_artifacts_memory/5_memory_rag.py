@@ -37,8 +37,11 @@ async def memory_rag_bind_and_upsert_demo(*, context: NodeContext):
 
     # 3) Search
     hits = await mem.rag_search(corpus_id=corpus_id, query="achromatic near-IR MTF low NA", k=4)
-    short = [{"chunk_id":h["chunk_id"], "doc_id":h["doc_id"], "score":float(h["score"]),
-              "snippet": (h["text"][:160] + "…") if len(h["text"])>160 else h["text"]} for h in hits]
+    short = []
+    for h in hits:
+        text = h["text"]
+        short.append({"chunk_id":h["chunk_id"], "doc_id":h["doc_id"], "score":float(h["score"]),
+                      "snippet": (text[:160] + "…") if len(text)>160 else text})
 
     await context.channel().send_text(f"[rag] corpus={corpus_id} hits={len(short)} for 'achromatic near-IR'")
     return {"corpus_id": corpus_id, "hits": short}
@@ -104,14 +107,17 @@ if __name__ == "__main__":
     from aethergraph.runner import run_async
     import asyncio
 
-    result1 = asyncio.run(run_async(memory_rag_bind_and_upsert_demo, inputs={}))
-    print("Result 1:", result1)
-    print()
+    async def main():
+        result1 = await run_async(memory_rag_bind_and_upsert_demo, inputs={})
+        print("Result 1:", result1)
+        print()
 
-    result2 = asyncio.run(run_async(memory_rag_promote_events_demo, inputs={}))
-    print("Result 2:", result2)
-    print()
+        result2 = await run_async(memory_rag_promote_events_demo, inputs={})
+        print("Result 2:", result2)
+        print()
 
-    result3 = asyncio.run(run_async(memory_rag_search_and_answer_demo, inputs={}))
-    print("Result 3:", result3)
-    print()
\ No newline at end of file
+        result3 = await run_async(memory_rag_search_and_answer_demo, inputs={})
+        print("Result 3:", result3)
+        print()
+
+    asyncio.run(main())
\ No newline at end of file
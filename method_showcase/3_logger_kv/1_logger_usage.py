@@ -10,7 +10,7 @@ async def logger_usage_example_tool(*, context: NodeContext):
     Use logger inside a tool to show node_id in logs.
     """
     log = context.logger()
-    log.info(f"[tool] This is a log message from tool in node {context.node_id}")
+    log.info("[tool] This is a log message from tool in node %s", context.node_id)
     # another log after tool done will also show before exiting the tool in execution
     return {"tool_logged": True}
     
@@ -32,7 +32,7 @@ async def logger_usage_example(*, context: NodeContext):
         # Simulate an operation that raises an exception
         result = 10 / 0
     except Exception as e:
-        log.error(f"An error occurred during computation: {e!r}")
+        log.error("An error occurred during computation: %r", e)
 
     await logger_usage_example_tool() # logger in tool context will show actual node_id
 
@@ -6,9 +6,9 @@ This script demonstrates creating a custom service with shared mutable state (a
 What it does:
 
 Defines a custom Materials service that:
-    Stores refractive index data: {material_name: {wavelength: refractive_index}}
-    Provides sync reads via get_n() - fast, lock-free access (eventual consistency)
-    Provides async writes via add_sample() - mutex-protected for thread safety
+    Stores refractive index data per material as sorted wavelength / refractive-index columns
+    Provides sync reads via get_n() - fast, lock-free access to an immutable snapshot
+    Provides async writes via add_sample() - mutex-protected, publishes a new snapshot in one assignment
     Registers the service globally so agents can access it via context.materials()
 
 Demo agent (materials_demo) that:
@@ -29,25 +29,50 @@ from aethergraph import graph_fn, NodeContext, Service
 from aethergraph import start_server
 from aethergraph.runtime import register_context_service   
 
-from typing import Dict
+from array import array
+from bisect import bisect_left
+from typing import Dict, Tuple
 
 class Materials(Service):
     def __init__(self, table: Dict[str, Dict[float, float]]):
         super().__init__()
-        self._table = table                 # shared mutable
-
-    # FAST sync read (eventual consistency; no lock)
+        # per material two parallel float64 columns: sorted wavelengths and indices
+        columns: Dict[str, Tuple[array, array]] = {}
+        for name, d in table.items():
+            if d:
+                wls = sorted(d)
+                columns[name] = (array("d", wls), array("d", (d[w] for w in wls)))
+        # shared state: (generation, columns). Writers publish a new tuple, never mutate the old one.
+        self._tables_v: Tuple[int, Dict[str, Tuple[array, array]]] = (0, columns)
+
+    # FAST sync read (consistent snapshot; no lock)
     def get_n(self, name: str, wl: float) -> float:
-        d = self._table.get(name, {})
-        if not d:
+        _, columns = self._tables_v
+        entry = columns.get(name)
+        if entry is None:
             raise KeyError(name)
-        wl0 = min(d.keys(), key=lambda x: abs(x - wl))
-        return float(d[wl0])
+        wls, ns = entry
+        i = bisect_left(wls, wl)
+        if i == len(wls) or (i > 0 and wl - wls[i - 1] <= wls[i] - wl):
+            i -= 1
+        return ns[i]
 
     # Write path: async + guarded with a mutex; no need to use _lock if you run graphs sequentially
     async def add_sample(self, name: str, wl: float, n: float) -> None:
+        wl, n = float(wl), float(n)
         async with self._lock:
-            self._table.setdefault(name, {})[float(wl)] = float(n)
+            # copy-on-write: lock-free readers keep the old snapshot until the swap below
+            version, columns = self._tables_v
+            wls, ns = columns.get(name, (array("d"), array("d")))
+            wls, ns = array("d", wls), array("d", ns)
+            i = bisect_left(wls, wl)
+            if i < len(wls) and wls[i] == wl:
+                ns[i] = n
+            else:
+                wls.insert(i, wl)
+                ns.insert(i, n)
+            # other materials' columns are shared by reference with the previous snapshot
+            self._tables_v = (version + 1, {**columns, name: (wls, ns)})
 
 @graph_fn(name="materials_demo")
 async def materials_demo(*, context: NodeContext):
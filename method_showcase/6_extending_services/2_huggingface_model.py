@@ -6,14 +6,16 @@ This script demonstrates integrating HuggingFace models as a custom service with
 What it does:
 
 Defines HFText service that wraps HuggingFace transformers:
-    Lazy initialization: Model loads only when first needed (via _ensure_loaded())
+    Eager preload: Model loads at startup (via start()/preload()), overlapping with sidecar bootstrap;
+        falls back to lazy loading on first use (via _ensure_loaded()) if it wasn't preloaded
+    Shared pipelines: Instances with the same (task, model) reuse one loaded pipeline
     Fallback mode: If transformers isn't installed, uses a stub implementation
     Thread-safe blocking calls: Uses run_blocking() to run CPU-heavy model operations without blocking the async event loop
 
 Provides analyze() method for sentiment analysis:
     Takes a list of text strings
     Returns sentiment labels (POSITIVE/NEGATIVE) with confidence scores
-    Runs model inference in a thread pool
+    Runs model inference in a thread pool, with at most HF_MAX_CONCURRENCY (default 2) calls in flight
 
 Demo agent (hf_text_demo) that:
     Analyzes 3 sample texts
@@ -22,7 +24,7 @@ Demo agent (hf_text_demo) that:
 
 Key concepts:
     Heavy ML models as services: Share expensive models across multiple agents
-    Lazy loading: Defer initialization until first use
+    Preloading: Pay model-load cost at startup instead of on the first request
     run_blocking(): Execute CPU-bound/synchronous code without blocking async agents
     Graceful degradation: Fallback stub when dependencies aren't available
 
@@ -34,32 +36,55 @@ from aethergraph import graph_fn, NodeContext, Service
 from aethergraph import start_server
 from aethergraph.runtime import register_context_service 
 
-from typing import List, Any 
+import asyncio
+import os
+import threading
+from typing import Dict, List, Any, Tuple
 
 class HFText(Service):
     """
-    Minimal HF wrapper with lazy load and fallback.
+    Minimal HF wrapper with eager preload, lazy fallback and a stub fallback.
     Methods are async-friendly; heavy work can go via run_blocking().
     """
-    def __init__(self, task: str = "sentiment-analysis", model: str | None = None):
+    # loaded pipelines shared by all instances, keyed by (task, model)
+    _PIPE_CACHE: Dict[Tuple[str, str | None], Any] = {}
+    _PIPE_CACHE_LOCK = threading.Lock()
+
+    def __init__(self, task: str = "sentiment-analysis", model: str | None = None, max_concurrency: int | None = None):
         super().__init__()
         self._task = task
         self._model = model
         self._pipe = None
+        # cap concurrent inference calls so callers queue here instead of oversubscribing CPU/GPU
+        if max_concurrency is None:
+            max_concurrency = int(os.environ.get("HF_MAX_CONCURRENCY", "2"))
+        self._sem = asyncio.Semaphore(max(1, max_concurrency))
 
-    async def _ensure_loaded(self):
+    def preload(self) -> None:
+        """Load the pipeline synchronously (blocking); safe to call from any thread."""
         if self._pipe is not None:
             return
-        try:
-            from transformers import pipeline
-        except Exception:
-            self._pipe = "fallback"  # mark that we’ll use a stub
-            return
+        key = (self._task, self._model)
+        with self._PIPE_CACHE_LOCK:
+            pipe = self._PIPE_CACHE.get(key)
+            if pipe is None:
+                try:
+                    from transformers import pipeline
+                except Exception:
+                    pipe = "fallback"  # mark that we’ll use a stub
+                else:
+                    pipe = pipeline(self._task, model=self._model) if self._model else pipeline(self._task)
+                self._PIPE_CACHE[key] = pipe
+        self._pipe = pipe
+
+    async def start(self) -> None:
+        await self._ensure_loaded()
 
-        def _load():
-            return pipeline(self._task, model=self._model) if self._model else pipeline(self._task)
+    async def _ensure_loaded(self):
+        if self._pipe is not None:
+            return
         # load in thread to avoid blocking loop
-        self._pipe = await self.run_blocking(_load)
+        await self.run_blocking(self.preload)
 
     async def analyze(self, texts: List[str]) -> Any:
         await self._ensure_loaded()
@@ -68,8 +93,10 @@ class HFText(Service):
             return [{"label": ("POSITIVE" if len(t) % 2 == 0 else "NEGATIVE"), "score": 0.5} for t in texts]
 
         def _call():
-            return self._pipe(texts)
-        return await self.run_blocking(_call)
+            # one batched pipeline call for all texts
+            return self._pipe(texts, batch_size=max(1, len(texts)))
+        async with self._sem:
+            return await self.run_blocking(_call)
     
 @graph_fn(name="hf_text_demo")
 async def hf_text_demo(*, context: NodeContext):
@@ -82,9 +109,16 @@ async def hf_text_demo(*, context: NodeContext):
 
 if __name__ == "__main__":
     from aethergraph.runner import run 
+
+    # Load the model while the sidecar boots so the first analyze() call doesn't pay for it.
+    hftext = HFText()
+    loader = threading.Thread(target=hftext.preload, daemon=True)
+    loader.start()
+
     start_server()
+    loader.join()
 
     # start the server before registering services
-    register_context_service("hftext", HFText())
+    register_context_service("hftext", hftext)
     
     run(hf_text_demo)
\ No newline at end of file